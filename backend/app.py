@@ -3,17 +3,40 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import feedparser
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import aiohttp
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import os
 from dotenv import load_dotenv
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import re
 import hashlib
+import xxhash
 import json
-from pymongo import MongoClient
+import orjson
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import ConnectionFailure, OperationFailure
 from bson import ObjectId
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import gevent
+    from gevent import monkey as gevent_monkey
+except ImportError:
+    gevent = None
+
 load_dotenv()
 
 app = Flask(__name__)
@@ -26,14 +49,69 @@ logger = logging.getLogger(__name__)
 # Configuration
 HF_API_KEY = os.getenv('HF_API_KEY', '')
 HF_API_URL = "https://api-inference.huggingface.co/models/facebook/bart-large-cnn"
+HF_SENTIMENT_API_URL = "https://api-inference.huggingface.co/models/cardiffnlp/twitter-roberta-base-sentiment-latest"
+HF_SUMMARY_PARAMETERS = {
+    "max_length": 100,
+    "min_length": 30,
+    "do_sample": False
+}
+HF_MAX_CONCURRENCY = 8
+HF_BATCH_SIZE = 16
+FEED_USER_AGENT = 'news-agg/1.0'
 MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/ai_news')
 
+# Stored articles expire after this many seconds
+ARTICLE_TTL = 7 * 24 * 60 * 60
+
+# AI results cache (keyed by content hash)
+AI_CACHE_SIZE = 4096
+AI_CACHE_TTL = 7 * 24 * 60 * 60
+
+# In-process cache of recent fetch_articles results (seconds)
+ARTICLE_CACHE_TTL = 300
+
+# Largest time window (hours) a client may request
+MAX_HOURS_BACK = 7 * 24
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Topic keywords; the first matching category wins
+CATEGORY_KEYWORDS = {
+    'Machine Learning': ['machine learning', 'ml', 'neural network', 'deep learning', 'algorithm'],
+    'Natural Language Processing': ['nlp', 'language model', 'chatbot', 'text', 'gpt'],
+    'Computer Vision': ['computer vision', 'image', 'vision', 'opencv', 'detection'],
+    'Robotics': ['robot', 'robotics', 'autonomous', 'automation'],
+    'Ethics & AI': ['ethics', 'bias', 'fairness', 'regulation', 'policy'],
+    'Business & AI': ['business', 'startup', 'investment', 'market', 'company'],
+    'Research': ['research', 'paper', 'study', 'university', 'academic']
+}
+
+_CATEGORY_PATTERNS = {
+    category: re.compile(r'\b(?:' + '|'.join(re.escape(k) for k in category_keywords) + ')', re.IGNORECASE)
+    for category, category_keywords in CATEGORY_KEYWORDS.items()
+}
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every category keyword"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (category, category_keywords) in enumerate(CATEGORY_KEYWORDS.items()):
+        for keyword in category_keywords:
+            if not automaton.exists(keyword):
+                automaton.add_word(keyword, (priority, category, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
 # Initialize MongoDB
 try:
     client = MongoClient(MONGODB_URI)
     db = client.get_default_database() if MONGODB_URI != 'mongodb://localhost:27017/ai_news' else client.ai_news
     articles_collection = db.articles
     sources_collection = db.sources
+    summary_cache_collection = db.summary_cache
     logger.info("MongoDB connected successfully")
 except Exception as e:
     logger.error(f"MongoDB connection failed: {str(e)}")
@@ -52,7 +130,35 @@ NEWS_SOURCES = [
 class NewsAggregator:
     def __init__(self):
         self.articles = []
+        self._ai_cache = OrderedDict()
+        self._ai_cache_lock = threading.Lock()
+        self.session = self._create_session()
+        self._articles_cache: Dict[int, Tuple[float, List[Dict]]] = {}
+        self._articles_cache_lock = threading.Lock()
+        self._articles_refill_locks: Dict[int, threading.Lock] = {}
+        self._etags: Dict[str, str] = {}
+        self._last_mod: Dict[str, str] = {}
+        self._feed_cache: Dict[str, list] = {}
         self.initialize_sources()
+        self._ensure_indexes()
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session with retries for outbound API calls"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST'])
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'Accept-Encoding': 'gzip'})
+        return session
     
     def initialize_sources(self):
         """Initialize sources in MongoDB"""
@@ -67,9 +173,74 @@ class NewsAggregator:
             except Exception as e:
                 logger.error(f"Error initializing sources: {str(e)}")
     
-    def fetch_articles(self, hours_back: int = 24) -> List[Dict]:
+    def _ensure_indexes(self):
+        """Create MongoDB indexes"""
+        if db is None:
+            return
+        
+        indexes = [
+            (articles_collection, 'id', {'unique': True}),
+            (articles_collection, [('published', -1)], {}),
+            (articles_collection, [('created_at', -1), ('category', 1)], {}),
+            # TTL index: MongoDB purges old articles on its own
+            (articles_collection, 'created_at', {'expireAfterSeconds': ARTICLE_TTL}),
+            (summary_cache_collection, 'created_at', {'expireAfterSeconds': AI_CACHE_TTL}),
+        ]
+        for collection, keys, options in indexes:
+            try:
+                collection.create_index(keys, **options)
+            except OperationFailure as e:
+                # e.g. existing duplicate ids block the unique index; the others can still be built
+                logger.error(f"Error creating index {keys} on {collection.name}: {str(e)}")
+            except ConnectionFailure as e:
+                # Every remaining index would wait out the same server selection timeout
+                logger.error(f"MongoDB unreachable, skipping index creation: {str(e)}")
+                return
+            except Exception as e:
+                logger.error(f"Error creating indexes: {str(e)}")
+                return
+    
+    def fetch_articles(self, hours_back: int = 24, force_refresh: bool = False) -> List[Dict]:
+        """Fetch articles, served from memory for ARTICLE_CACHE_TTL seconds"""
+        requested_at = time.monotonic()
+        if not force_refresh:
+            articles = self._get_cached_articles(hours_back)
+            if articles is not None:
+                return articles
+        
+        # Only callers refilling the same hours_back wait on each other
+        with self._articles_cache_lock:
+            refill_lock = self._articles_refill_locks.setdefault(hours_back, threading.Lock())
+        
+        with refill_lock:
+            # Reuse a refill that finished while we waited (for a forced refresh, only one started after the request)
+            articles = self._get_cached_articles(hours_back, newer_than=requested_at if force_refresh else None)
+            if articles is not None:
+                return articles
+            
+            articles = self._fetch_articles(hours_back)
+            if articles:
+                now = time.monotonic()
+                with self._articles_cache_lock:
+                    # Drop expired windows so stale article lists are not kept around
+                    for key in [k for k, (cached_at, _) in self._articles_cache.items() if now - cached_at >= ARTICLE_CACHE_TTL]:
+                        del self._articles_cache[key]
+                    self._articles_cache[hours_back] = (now, articles)
+            return articles
+    
+    def _get_cached_articles(self, hours_back: int, newer_than: Optional[float] = None) -> Optional[List[Dict]]:
+        """Return the in-process cached articles for hours_back if still fresh"""
+        with self._articles_cache_lock:
+            cached_at, articles = self._articles_cache.get(hours_back, (0, None))
+        if articles is None or time.monotonic() - cached_at >= ARTICLE_CACHE_TTL:
+            return None
+        if newer_than is not None and cached_at < newer_than:
+            return None
+        return articles
+    
+    def _fetch_articles(self, hours_back: int) -> List[Dict]:
         """Fetch articles from all news sources"""
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
         
         # Try to get cached articles from MongoDB first
         if db is not None:
@@ -92,53 +263,111 @@ class NewsAggregator:
         all_articles = []
         active_sources = self.get_active_sources()
         
-        for source in active_sources:
-            try:
-                logger.info(f"Fetching from {source['name']}")
-                feed = feedparser.parse(source['url'])
-                
-                for entry in feed.entries:
-                    # Parse publish date
-                    published = datetime.now()
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        published = datetime(*entry.published_parsed[:6])
-                    
-                    # Only include recent articles
-                    if published > cutoff_time:
-                        # Create unique ID for deduplication
-                        content = self.clean_html(getattr(entry, 'summary', ''))
-                        article_id = hashlib.md5((entry.title + source['name']).encode()).hexdigest()
-                        
-                        article = {
-                            'id': article_id,
-                            'title': entry.title,
-                            'summary': getattr(entry, 'summary', ''),
-                            'link': entry.link,
-                            'published': published.isoformat(),
-                            'source': source['name'],
-                            'content': content,
-                            'ai_summary': '',
-                            'sentiment': 'neutral',
-                            'created_at': datetime.now(),
-                            'updated_at': datetime.now()
-                        }
-                        
-                        # Generate AI summary and sentiment
-                        if article['content']:
-                            article['ai_summary'] = self.summarize_article(article['content'])
-                            article['sentiment'] = self.get_sentiment(article['title'] + ' ' + article['content'][:200])
-                        
-                        all_articles.append(article)
-                        
-            except Exception as e:
-                logger.error(f"Error fetching from {source['name']}: {str(e)}")
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(active_sources)))) as executor:
+            futures = [executor.submit(self._fetch_one_source, source, cutoff_time) for source in active_sources]
+            for future in as_completed(futures):
+                all_articles.extend(future.result())
         
-        # Remove duplicates and save to MongoDB
+        # Remove duplicates first so AI work is only done for articles we keep
         unique_articles = self.remove_duplicates(all_articles)
+        
+        # Generate AI summary and sentiment, then save to MongoDB
+        self._enrich_articles(unique_articles)
         self.save_articles_to_db(unique_articles)
         
         return sorted(unique_articles, key=lambda x: x['published'], reverse=True)
     
+    def _fetch_one_source(self, source: Dict, cutoff_time: datetime) -> List[Dict]:
+        """Fetch and parse recent articles from a single news source"""
+        articles = []
+        try:
+            logger.info(f"Fetching from {source['name']}")
+            entries = self._fetch_feed_entries(source['url'])
+            
+            for entry in entries:
+                # Parse publish date
+                published = self._parse_published(entry)
+                
+                # Only include recent articles
+                if published > cutoff_time:
+                    # Create unique ID for deduplication
+                    content = self.clean_html(getattr(entry, 'summary', ''))
+                    article_id = xxhash.xxh3_64_hexdigest((entry.title + source['name']).encode())
+                    
+                    article = {
+                        'id': article_id,
+                        'title': entry.title,
+                        'summary': getattr(entry, 'summary', ''),
+                        'link': entry.link,
+                        'published': published.isoformat(),
+                        'source': source['name'],
+                        'content': content,
+                        'category': self.categorize(entry.title + ' ' + content),
+                        'ai_summary': '',
+                        'sentiment': 'neutral',
+                        'created_at': datetime.now(timezone.utc),
+                        'updated_at': datetime.now(timezone.utc)
+                    }
+                    
+                    articles.append(article)
+                    
+        except Exception as e:
+            logger.error(f"Error fetching from {source['name']}: {str(e)}")
+        
+        return articles
+    
+    def _parse_published(self, entry) -> datetime:
+        """Timezone-aware (UTC) publish date of a feed entry"""
+        published = getattr(entry, 'published', None)
+        if published:
+            try:
+                # RSS pubDate (RFC 2822)
+                parsed = parsedate_to_datetime(published)
+            except (TypeError, ValueError):
+                try:
+                    # Atom (ISO 8601)
+                    parsed = datetime.fromisoformat(published)
+                except ValueError:
+                    parsed = None
+            if parsed is not None:
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                return parsed.astimezone(timezone.utc)
+        
+        if getattr(entry, 'published_parsed', None):
+            return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+        return datetime.now(timezone.utc)
+    
+    def _fetch_feed_entries(self, url: str) -> list:
+        """Download a feed over the shared session and parse it, reusing the last parse if unchanged"""
+        headers = {'User-Agent': FEED_USER_AGENT}
+        # Conditional GET only when there is a parsed copy to fall back on
+        if url in self._feed_cache:
+            if url in self._etags:
+                headers['If-None-Match'] = self._etags[url]
+            if url in self._last_mod:
+                headers['If-Modified-Since'] = self._last_mod[url]
+        
+        response = self.session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            logger.info(f"Feed not modified: {url}")
+            return self._feed_cache[url]
+        response.raise_for_status()
+        
+        # Pass the HTTP headers through so feedparser still sees the charset and base URL
+        # (feedparser only looks up lowercase header names)
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+        entries = feedparser.parse(
+            response.content,
+            response_headers={**response_headers, 'content-location': response.url}
+        ).entries
+        self._feed_cache[url] = entries
+        if response.headers.get('ETag'):
+            self._etags[url] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            self._last_mod[url] = response.headers['Last-Modified']
+        return entries
+    
     def get_active_sources(self) -> List[Dict]:
         """Get active sources from MongoDB or fallback to default"""
         if db is not None:
@@ -155,20 +384,67 @@ class NewsAggregator:
         """Save articles to MongoDB"""
         if db is not None and articles:
             try:
-                for article in articles:
-                    articles_collection.update_one(
-                        {'id': article['id']},
-                        {'$set': article},
-                        upsert=True
-                    )
+                articles_collection.bulk_write([
+                    UpdateOne({'id': article['id']}, {'$set': article}, upsert=True)
+                    for article in articles
+                ], ordered=False)
                 logger.info(f"Saved {len(articles)} articles to database")
             except Exception as e:
                 logger.error(f"Error saving articles to DB: {str(e)}")
     
     def clean_html(self, text: str) -> str:
         """Remove HTML tags from text"""
-        clean = re.compile('<.*?>')
-        return re.sub(clean, '', text)
+        return _HTML_TAG_RE.sub('', text)
+    
+    def categorize(self, text: str) -> str:
+        """Return the first category (in CATEGORY_KEYWORDS order) whose keywords appear in text"""
+        if _KEYWORD_AUTOMATON is None:
+            for category, pattern in _CATEGORY_PATTERNS.items():
+                if pattern.search(text):
+                    return category
+            return 'General'
+        
+        # Single pass over the text; keep the highest-priority keyword that starts on a word boundary
+        text = text.lower()
+        best = None
+        for end, (priority, category, length) in _KEYWORD_AUTOMATON.iter(text):
+            start = end - length + 1
+            if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                continue
+            if best is None or priority < best[0]:
+                best = (priority, category)
+                if priority == 0:
+                    break
+        
+        return best[1] if best else 'General'
+    
+    def get_category_counts(self, hours_back: int = 24) -> Dict[str, int]:
+        """Count recent articles per category (assigned at ingest time)"""
+        categories = {category: 0 for category in CATEGORY_KEYWORDS}
+        categories['General'] = 0
+        
+        if db is not None:
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
+            pipeline = [
+                {'$match': {
+                    'created_at': {'$gte': cutoff_time},
+                    'published': {'$gte': cutoff_time.isoformat()}
+                }},
+                {'$group': {'_id': '$category', 'count': {'$sum': 1}}}
+            ]
+            try:
+                groups = list(articles_collection.aggregate(pipeline))
+                for group in groups:
+                    # Articles stored before categories were assigned at ingest count as General
+                    category = group['_id'] if group['_id'] in categories else 'General'
+                    categories[category] += group['count']
+                return categories
+            except Exception as e:
+                logger.error(f"Error aggregating categories: {str(e)}")
+        
+        for article in self.fetch_articles(hours_back):
+            categories[article.get('category', 'General')] += 1
+        return categories
     
     def remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
         """Remove duplicate articles based on title similarity"""
@@ -176,13 +452,101 @@ class NewsAggregator:
         unique_articles = []
         
         for article in articles:
-            title_key = article['title'].lower().strip()
+            title_key = xxhash.xxh3_64_intdigest(' '.join(article['title'].lower().split()).encode())
             if title_key not in seen_titles:
                 seen_titles.add(title_key)
                 unique_articles.append(article)
         
         return unique_articles
     
+    def _hf_headers(self) -> Dict:
+        """Build request headers for the Hugging Face API"""
+        headers = {}
+        if HF_API_KEY:
+            headers["Authorization"] = f"Bearer {HF_API_KEY}"
+        return headers
+    
+    def _fallback_summary(self, clean_content: str) -> str:
+        """Truncated content used when no AI summary is available"""
+        return clean_content[:200] + "..." if len(clean_content) > 200 else clean_content
+    
+    def _parse_summary(self, result) -> Optional[str]:
+        """Extract the summary text from a Hugging Face summarization response; None if absent"""
+        if isinstance(result, list) and len(result) > 0:
+            result = result[0]
+        if isinstance(result, dict) and result.get('summary_text'):
+            return result['summary_text']
+        return None
+    
+    def _parse_sentiment(self, result) -> Optional[str]:
+        """Map a Hugging Face sentiment response to positive/negative/neutral; None if unrecognised"""
+        if isinstance(result, list) and len(result) > 0:
+            sentiment_data = result[0]
+            if isinstance(sentiment_data, list) and len(sentiment_data) > 0 and isinstance(sentiment_data[0], dict):
+                label = sentiment_data[0].get('label')
+                if not label:
+                    return None
+                label = label.lower()
+                # Map sentiment labels
+                if 'pos' in label:
+                    return 'positive'
+                elif 'neg' in label:
+                    return 'negative'
+                else:
+                    return 'neutral'
+        return None
+    
+    def _content_hash(self, text: str) -> str:
+        """Stable cache key for a piece of text sent to the Hugging Face API"""
+        # Whitespace-only edits (common in re-syndicated feeds) map to the same key
+        normalized = ' '.join(text.split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    
+    def _get_cached_results(self, kind: str, content_hashes: List[str], use_db: bool = True) -> Dict[str, str]:
+        """Look up cached AI results ('summary' or 'sentiment') in memory, then MongoDB"""
+        found = {}
+        with self._ai_cache_lock:
+            for content_hash in content_hashes:
+                key = (kind, content_hash)
+                if key in self._ai_cache:
+                    self._ai_cache.move_to_end(key)
+                    found[content_hash] = self._ai_cache[key]
+        
+        missing = [h for h in set(content_hashes) if h not in found]
+        if use_db and db is not None and missing:
+            try:
+                for doc in summary_cache_collection.find({'_id': {'$in': missing}, kind: {'$exists': True}}):
+                    found[doc['_id']] = doc[kind]
+                    self._remember_result(kind, doc['_id'], doc[kind])
+            except Exception as e:
+                logger.error(f"Error reading AI result cache: {str(e)}")
+        
+        return found
+    
+    def _remember_result(self, kind: str, content_hash: str, value: str):
+        """Store an AI result in the in-process LRU cache"""
+        key = (kind, content_hash)
+        with self._ai_cache_lock:
+            self._ai_cache[key] = value
+            self._ai_cache.move_to_end(key)
+            while len(self._ai_cache) > AI_CACHE_SIZE:
+                self._ai_cache.popitem(last=False)
+    
+    def _cache_results(self, kind: str, results: Dict[str, str], use_db: bool = True):
+        """Store AI results in memory and in the MongoDB summary cache"""
+        for content_hash, value in results.items():
+            self._remember_result(kind, content_hash, value)
+        
+        if use_db and db is not None and results:
+            try:
+                now = datetime.now(timezone.utc)
+                summary_cache_collection.bulk_write([
+                    UpdateOne({'_id': content_hash}, {'$set': {kind: value, 'created_at': now}}, upsert=True)
+                    for content_hash, value in results.items()
+                ], ordered=False)
+            except Exception as e:
+                logger.error(f"Error writing AI result cache: {str(e)}")
+    
     def summarize_article(self, content: str) -> str:
         """Generate AI summary using Hugging Face API"""
         clean_content = self.clean_html(content)
@@ -192,74 +556,181 @@ class NewsAggregator:
         if len(clean_content) < 50:
             return clean_content
         
+        content_hash = self._content_hash(clean_content)
+        # Single-item lookups stay in memory; a MongoDB round-trip would cost more than it saves
+        cached = self._get_cached_results('summary', [content_hash], use_db=False)
+        if content_hash in cached:
+            return cached[content_hash]
+        
         try:
-            headers = {}
-            if HF_API_KEY:
-                headers["Authorization"] = f"Bearer {HF_API_KEY}"
-            
-            response = requests.post(
+            response = self.session.post(
                 HF_API_URL,
-                headers=headers,
+                headers=self._hf_headers(),
                 json={
                     "inputs": clean_content,
-                    "parameters": {
-                        "max_length": 100,
-                        "min_length": 30,
-                        "do_sample": False
-                    }
+                    "parameters": HF_SUMMARY_PARAMETERS
                 },
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
-                if isinstance(result, list) and len(result) > 0:
-                    return result[0].get('summary_text', clean_content[:200] + "...")
-                elif isinstance(result, dict) and 'summary_text' in result:
-                    return result['summary_text']
+                summary = self._parse_summary(response.json())
+                if summary is not None:
+                    self._cache_results('summary', {content_hash: summary}, use_db=False)
+                    return summary
             
-            return clean_content[:200] + "..." if len(clean_content) > 200 else clean_content
+            return self._fallback_summary(clean_content)
             
         except Exception as e:
             logger.error(f"Error generating summary: {str(e)}")
-            return clean_content[:200] + "..." if len(clean_content) > 200 else clean_content
+            return self._fallback_summary(clean_content)
     
     def get_sentiment(self, text: str) -> str:
         """Get sentiment analysis using Hugging Face"""
+        text = text[:500]
+        content_hash = self._content_hash(text)
+        cached = self._get_cached_results('sentiment', [content_hash], use_db=False)
+        if content_hash in cached:
+            return cached[content_hash]
+        
         try:
-            headers = {}
-            if HF_API_KEY:
-                headers["Authorization"] = f"Bearer {HF_API_KEY}"
-            
-            response = requests.post(
-                "https://api-inference.huggingface.co/models/cardiffnlp/twitter-roberta-base-sentiment-latest",
-                headers=headers,
-                json={"inputs": text[:500]},
+            response = self.session.post(
+                HF_SENTIMENT_API_URL,
+                headers=self._hf_headers(),
+                json={"inputs": text},
                 timeout=10
             )
             
             if response.status_code == 200:
-                result = response.json()
-                if isinstance(result, list) and len(result) > 0:
-                    sentiment_data = result[0]
-                    if isinstance(sentiment_data, list) and len(sentiment_data) > 0:
-                        label = sentiment_data[0].get('label', 'neutral').lower()
-                        # Map sentiment labels
-                        if 'pos' in label:
-                            return 'positive'
-                        elif 'neg' in label:
-                            return 'negative'
-                        else:
-                            return 'neutral'
+                sentiment = self._parse_sentiment(response.json())
+                if sentiment is not None:
+                    self._cache_results('sentiment', {content_hash: sentiment}, use_db=False)
+                    return sentiment
             
             return 'neutral'
         except Exception as e:
             logger.error(f"Error getting sentiment: {str(e)}")
             return 'neutral'
+    
+    def _enrich_articles(self, articles: List[Dict]):
+        """Generate AI summaries and sentiment for all articles"""
+        articles = [article for article in articles if article['content']]
+        if not articles:
+            return
+        
+        summary_inputs = [a['content'][:1000] for a in articles]
+        sentiment_inputs = [(a['title'] + ' ' + a['content'][:200])[:500] for a in articles]
+        summaries, sentiments = self._run_batched_inference(summary_inputs, sentiment_inputs)
+        
+        for article, summary, sentiment, text in zip(articles, summaries, sentiments, summary_inputs):
+            article['ai_summary'] = summary or self._fallback_summary(text)
+            article['sentiment'] = sentiment or 'neutral'
+    
+    def _run_batched_inference(self, summary_inputs: List[str], sentiment_inputs: List[str]) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """Resolve summaries and sentiments from the cache or batched API calls; None where unavailable"""
+        summary_hashes = [self._content_hash(text) for text in summary_inputs]
+        sentiment_hashes = [self._content_hash(text) for text in sentiment_inputs]
+        
+        # Only content that has never been processed goes to the API
+        summaries = self._get_cached_results('summary', summary_hashes)
+        sentiments = self._get_cached_results('sentiment', sentiment_hashes)
+        pending_summaries = {
+            h: text for h, text in zip(summary_hashes, summary_inputs)
+            if h not in summaries and len(text) >= 50
+        }
+        pending_sentiments = {
+            h: text for h, text in zip(sentiment_hashes, sentiment_inputs)
+            if h not in sentiments
+        }
+        
+        if pending_summaries or pending_sentiments:
+            new_summaries, new_sentiments = self._run_async(self._infer_all(pending_summaries, pending_sentiments))
+            self._cache_results('summary', new_summaries)
+            self._cache_results('sentiment', new_sentiments)
+            summaries.update(new_summaries)
+            sentiments.update(new_sentiments)
+        
+        return [summaries.get(h) for h in summary_hashes], [sentiments.get(h) for h in sentiment_hashes]
+    
+    def _run_async(self, coro):
+        """Run a coroutine to completion in its own event loop"""
+        if gevent is not None and gevent_monkey.is_module_patched('threading'):
+            # Under gevent workers (wsgi.py) every request is a greenlet on one OS thread, so a
+            # second asyncio.run would find the first one's loop; give each run a real thread
+            return gevent.get_hub().threadpool.apply(asyncio.run, (coro,))
+        return asyncio.run(coro)
+    
+    async def _infer_all(self, pending_summaries: Dict[str, str], pending_sentiments: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Send batched summary and sentiment requests concurrently"""
+        summary_batches = self._batches(list(pending_summaries.items()))
+        sentiment_batches = self._batches(list(pending_sentiments.items()))
+        
+        semaphore = asyncio.Semaphore(HF_MAX_CONCURRENCY)
+        async with aiohttp.ClientSession(
+            headers=self._hf_headers(),
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as session:
+            results = await asyncio.gather(
+                *(self._post_batch(session, semaphore, HF_API_URL, [text for _, text in batch], HF_SUMMARY_PARAMETERS)
+                  for batch in summary_batches),
+                *(self._post_batch(session, semaphore, HF_SENTIMENT_API_URL, [text for _, text in batch])
+                  for batch in sentiment_batches)
+            )
+        
+        summaries = {}
+        for batch, result in zip(summary_batches, results):
+            if result is not None:
+                for (h, _), item in zip(batch, result):
+                    summary = self._parse_summary([item])
+                    if summary is not None:
+                        summaries[h] = summary
+        
+        sentiments = {}
+        for batch, result in zip(sentiment_batches, results[len(summary_batches):]):
+            if result is not None:
+                for (h, _), item in zip(batch, result):
+                    sentiment = self._parse_sentiment([item])
+                    if sentiment is not None:
+                        sentiments[h] = sentiment
+        
+        return summaries, sentiments
+    
+    def _batches(self, items: list) -> List[list]:
+        """Split items into chunks of HF_BATCH_SIZE"""
+        return [items[i:i + HF_BATCH_SIZE] for i in range(0, len(items), HF_BATCH_SIZE)]
+    
+    async def _post_batch(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str, inputs: List[str], parameters: Optional[Dict] = None) -> Optional[list]:
+        """POST a list of inputs to a Hugging Face model; one result per input, or None on failure"""
+        payload = {"inputs": inputs}
+        if parameters:
+            payload["parameters"] = parameters
+        
+        try:
+            async with semaphore:
+                async with session.post(url, json=payload) as response:
+                    if response.status != 200:
+                        logger.error(f"Batch request to {url} failed with status {response.status}")
+                        return None
+                    result = await response.json()
+                    if isinstance(result, list) and len(result) == len(inputs):
+                        return result
+                    got = len(result) if isinstance(result, list) else type(result).__name__
+                    logger.error(f"Unexpected batch response from {url}: expected {len(inputs)} results, got {got}")
+        except Exception as e:
+            logger.error(f"Error in batch request to {url}: {str(e)}")
+        return None
 
 # Initialize aggregator
 aggregator = NewsAggregator()
 
+def ojsonify(obj, status: int = 200):
+    """jsonify equivalent backed by orjson, for large payloads"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC),
+        status=status,
+        mimetype='application/json'
+    )
+
 @app.route('/')
 def health_check():
     return jsonify({
@@ -273,20 +744,20 @@ def health_check():
 def get_news():
     """Get aggregated news articles"""
     try:
-        hours_back = request.args.get('hours', 24, type=int)
+        hours_back = min(max(request.args.get('hours', 24, type=int), 1), MAX_HOURS_BACK)
         force_refresh = request.args.get('refresh', 'false').lower() == 'true'
         
         if force_refresh and db is not None:
             # Clear cache for forced refresh
             try:
-                cutoff_time = datetime.now() - timedelta(hours=hours_back)
+                cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
                 articles_collection.delete_many({'created_at': {'$gte': cutoff_time}})
             except Exception as e:
                 logger.error(f"Error clearing cache: {str(e)}")
         
-        articles = aggregator.fetch_articles(hours_back)
+        articles = aggregator.fetch_articles(hours_back, force_refresh=force_refresh)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'articles': articles,
             'count': len(articles),
@@ -295,55 +766,21 @@ def get_news():
         })
     except Exception as e:
         logger.error(f"Error fetching news: {str(e)}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return ojsonify({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/categories', methods=['GET'])
 def get_categories():
     """Get article categories/topics"""
     try:
-        articles = aggregator.fetch_articles(24)
-        
-        categories = {
-            'Machine Learning': 0,
-            'Natural Language Processing': 0,
-            'Computer Vision': 0,
-            'Robotics': 0,
-            'Ethics & AI': 0,
-            'Business & AI': 0,
-            'Research': 0,
-            'General': 0
-        }
+        categories = aggregator.get_category_counts(24)
         
-        keywords = {
-            'Machine Learning': ['machine learning', 'ml', 'neural network', 'deep learning', 'algorithm'],
-            'Natural Language Processing': ['nlp', 'language model', 'chatbot', 'text', 'gpt'],
-            'Computer Vision': ['computer vision', 'image', 'vision', 'opencv', 'detection'],
-            'Robotics': ['robot', 'robotics', 'autonomous', 'automation'],
-            'Ethics & AI': ['ethics', 'bias', 'fairness', 'regulation', 'policy'],
-            'Business & AI': ['business', 'startup', 'investment', 'market', 'company'],
-            'Research': ['research', 'paper', 'study', 'university', 'academic']
-        }
-        
-        for article in articles:
-            text = (article['title'] + ' ' + article['content']).lower()
-            categorized = False
-            
-            for category, category_keywords in keywords.items():
-                if any(keyword in text for keyword in category_keywords):
-                    categories[category] += 1
-                    categorized = True
-                    break
-            
-            if not categorized:
-                categories['General'] += 1
-        
-        return jsonify({
+        return ojsonify({
             'success': True,
             'categories': categories
         })
     except Exception as e:
         logger.error(f"Error getting categories: {str(e)}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return ojsonify({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/sources', methods=['GET'])
 def get_sources():
@@ -362,7 +799,7 @@ def get_sources():
 def summarize_article():
     """Summarize a specific article"""
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data())
         content = data.get('content', '')
         
         if not content:
@@ -382,7 +819,7 @@ def summarize_article():
 def analyze_sentiment():
     """Analyze sentiment of text"""
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data())
         text = data.get('text', '')
         
         if not text:
@@ -0,0 +1,6 @@
+# wsgi.py - Production entry point (gunicorn -k gevent wsgi:app)
+# Patch the standard library before importing the app so its I/O yields to other requests
+from gevent import monkey
+monkey.patch_all()
+
+from app import app